@@ -1,19 +1,287 @@
+import argparse
+import functools
 import logging
 import math
-from typing import Dict, Optional
-
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler("logs/zodiac_calculator.log"),
-        logging.StreamHandler(),
-    ],
-)
+import os
+import sys
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for the vectorized helpers
+    np = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
+def _configure_logging() -> None:
+    """Set up file and console logging for the command line calculator."""
+    # Create logs directory if it doesn't exist
+    os.makedirs("logs", exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+        handlers=[
+            logging.FileHandler("logs/zodiac_calculator.log"),
+            logging.StreamHandler(),
+        ],
+    )
+
+
+# Natural logs of constant power bases, so c**x can be evaluated as exp(ln(c) * x)
+LN_1_125 = math.log(1.125)
+LN_1_1 = math.log(1.1)
+LN_1_3 = math.log(1.3)
+LN_0_9 = math.log(0.9)
+_INF = float("inf")
+
+# Format specs used by ZodiacCalculator._format_number, by magnitude
+_FMT_SCI = ".2e"
+_FMT_2 = ".2f"
+_FMT_6 = ".6f"
+_FMT_8 = ".8f"
+
+
+RARITY_NAMES = (
+    "Garbage",
+    "Common",
+    "Uncommon",
+    "Rare",
+    "Epic",
+    "Legendary",
+    "Mythic",
+    "Godly",
+    "Divine",
+    "Immortal",
+)
+_ZERO_WEIGHTS = (0.0,) * len(RARITY_NAMES)
+
+# Piecewise rarity weight formulas in RARITY_NAMES order, as
+# (lo, hi, coef, base, shift, offset, decays). For lo <= luck < hi a weight is
+# max(0, coef * base ** (luck - shift) - offset), multiplied by
+# decay ** (luck - start) for each (start, decay) stage with start <= luck.
+# Outside [lo, hi) the weight is zero; an infinite hi is inclusive.
+_RarityRow = Tuple[
+    float, float, float, float, float, float, Tuple[Tuple[float, float], ...]
+]
+_RARITY_TABLE: Tuple[_RarityRow, ...] = (
+    (1, 3, 5, 0.8, 1, 0, ((2, 0.4),)),  # Garbage
+    (1, 5, 15, 1.0, 0, 0, ((2, 0.45),)),  # Common
+    (1, 8, 20, 1.5, 1, 12, ((3, 0.5),)),  # Uncommon
+    (1, 12, 30, 1.45, 1, 28, ((5, 0.55),)),  # Rare
+    (1, 20, 45, 1.4, 2, 50, ((8, 0.6),)),  # Epic
+    (1, 30, 80, 1.36, 3, 100, ((12, 0.64),)),  # Legendary
+    (1, 50, 120, 1.3, 5, 140, ((20, 0.67),)),  # Mythic
+    (1, 60, 150, 1.25, 8, 200, ((30, 0.7),)),  # Godly
+    (1, 70, 200, 1.2, 12, 300, ((40, 0.92), (50, 0.75))),  # Divine
+    (-_INF, _INF, 300, 1.1, 20, 500, ()),  # Immortal
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _zodiac_score(rarity: float, quality: float, level: float) -> float:
+    """
+    Calculate Zodiac Score, shared by the score and sale price calculations
+
+    Args:
+        rarity: Zodiac rarity
+        quality: Zodiac quality
+        level: Zodiac level
+
+    Returns:
+        float: Zodiac score
+    """
+    # Conditional multipliers, written branch-free. (level - 90) / 10 is at
+    # least 1 exactly when level >= 100, so clamping it to 1 yields a
+    # multiplier of 1 below that threshold.
+    rarity_mult = 1.0 + float(rarity > 8)
+    level_mult = max(1.0, (level - 90.0) * 0.1) ** 2.5
+
+    return (
+        math.exp(LN_1_125 * rarity)
+        * quality
+        * (9 + level * level)
+        * rarity_mult
+        * level_mult
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _sale_price(rarity: float, quality: float, level: float) -> float:
+    """
+    Calculate Zodiac Sale Price from the zodiac score
+
+    Args:
+        rarity: Zodiac rarity
+        quality: Zodiac quality
+        level: Zodiac level
+
+    Returns:
+        float: Sale price
+
+    Raises:
+        ValueError: If the zodiac score is negative
+    """
+    # x ** 0.75 == sqrt(x) * sqrt(sqrt(x)), avoiding a general pow call
+    root = math.sqrt(_zodiac_score(rarity, quality, level) * 0.1)
+    return root * math.sqrt(root) * math.exp(LN_1_1 * rarity)
+
+
+@functools.lru_cache(maxsize=128)
+def _log10_1p(quality: float) -> float:
+    """
+    Calculate log10(1 + quality), shared by enhance price and chance
+
+    Args:
+        quality: Zodiac quality
+
+    Returns:
+        float: log10(1 + quality)
+    """
+    return math.log10(1.0 + quality)
+
+
+@functools.lru_cache(maxsize=128)
+def _enhance_price(sell_cost: float, quality: float) -> float:
+    """
+    Calculate Zodiac Enhance Price from an already computed sale price
+
+    Args:
+        sell_cost: Zodiac sale price
+        quality: Zodiac quality
+
+    Returns:
+        float: Enhance price
+    """
+    return sell_cost * 2.0 * math.exp(LN_1_3 * _log10_1p(quality))
+
+
+@functools.lru_cache(maxsize=128)
+def _enhance_chance(quality: float) -> float:
+    """
+    Calculate Zodiac Enhance Chance
+
+    Args:
+        quality: Zodiac quality
+
+    Returns:
+        float: Enhance chance as a percentage
+    """
+    log10_1pq = _log10_1p(quality)
+    return math.exp(LN_0_9 * log10_1pq * log10_1pq) * 100.0
+
+
+@functools.lru_cache(maxsize=128)
+def _zodiac_luck(luck: float) -> float:
+    """
+    Calculate Zodiac Luck with soft cap
+
+    Args:
+        luck: Luck stat
+
+    Returns:
+        float: Zodiac luck
+    """
+    if luck < 18:
+        return luck
+    return (luck - 18) ** 0.3 * 18
+
+
+@functools.lru_cache(maxsize=256)
+def _rarity_weights_kernel(luck: float) -> Tuple[float, ...]:
+    """
+    Evaluate the rarity weight formulas in _RARITY_TABLE for a single luck value
+
+    Args:
+        luck: The calculated zodiac luck value
+
+    Returns:
+        Tuple[float, ...]: Weights in RARITY_NAMES order
+
+    Raises:
+        OverflowError: If an intermediate power overflows
+    """
+    weights = []
+    for lo, hi, coef, base, shift, offset, decays in _RARITY_TABLE:
+        # An infinite upper bound is inclusive so luck == inf stays in range
+        in_range = lo <= luck < hi if hi != _INF else lo <= luck
+        if not in_range:
+            weights.append(0.0)
+            continue
+
+        weight = max(0.0, coef * base ** (luck - shift) - offset)
+        for start, decay in decays:
+            if luck >= start:
+                weight *= decay ** (luck - start)
+        weights.append(weight)
+
+    return tuple(weights)
+
+
+@functools.lru_cache(maxsize=256)
+def _rarity_chances(weights: Tuple[float, ...]) -> Tuple[float, ...]:
+    """
+    Convert rarity weights into percentage chances
+
+    Args:
+        weights: Rarity weights in RARITY_NAMES order
+
+    Returns:
+        Tuple[float, ...]: Rarity chances in RARITY_NAMES order, _ZERO_WEIGHTS if
+        the total weight is zero
+    """
+    total_weight = sum(weights)
+    if total_weight == 0:
+        return _ZERO_WEIGHTS
+
+    scale = 100.0 / total_weight
+    return tuple(weight * scale for weight in weights)
+
+
+def calculate_rarity_weights_vec(luck: Any) -> Any:
+    """
+    Calculate weights for all rarities over an array of zodiac luck values
+
+    Vectorized counterpart of ZodiacCalculator.calculate_rarity_weights. Columns
+    are ordered Garbage, Common, Uncommon, Rare, Epic, Legendary, Mythic, Godly,
+    Divine, Immortal.
+
+    Args:
+        luck: Scalar or array-like of zodiac luck values
+
+    Returns:
+        np.ndarray: Array of shape (N, 10) with the rarity weights for each value
+
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    if np is None:
+        raise ImportError("NumPy is required for vectorized rarity weights")
+
+    luck = np.atleast_1d(np.asarray(luck, dtype=np.float64)).ravel()
+    weights = np.empty((luck.shape[0], len(RARITY_NAMES)), dtype=np.float64)
+
+    with np.errstate(over="ignore", invalid="ignore"):
+        for column, row in enumerate(_RARITY_TABLE):
+            lo, hi, coef, base, shift, offset, decays = row
+
+            # One choice per segment: the growth term, then each decay stage
+            value = np.maximum(0.0, coef * np.power(base, luck - shift) - offset)
+            choices = [value]
+            for start, decay in decays:
+                value = value * np.power(decay, luck - start)
+                choices.append(value)
+
+            bounds = (lo,) + tuple(start for start, _ in decays) + (hi,)
+            conditions = [
+                (luck >= seg_lo) & ((luck < seg_hi) if seg_hi != _INF else True)
+                for seg_lo, seg_hi in zip(bounds, bounds[1:])
+            ]
+            weights[:, column] = np.select(conditions, choices, 0.0)
+
+    return weights
+
+
 class ZodiacCalculator:
     """
     Revolution Idle Zodiac Calculator
@@ -22,6 +290,14 @@ class ZodiacCalculator:
     All inputs are optional - calculations are performed based on available data.
     """
 
+    __slots__ = (
+        "zodiac_rarity",
+        "zodiac_quality",
+        "zodiac_level",
+        "luck",
+        "immo_number",
+    )
+
     def __init__(self) -> None:
         """Initialize calculator with optional input values."""
         self.zodiac_rarity: Optional[float] = None
@@ -31,6 +307,85 @@ class ZodiacCalculator:
         self.immo_number: Optional[float] = None
         logger.debug("ZodiacCalculator initialized")
 
+    @staticmethod
+    def compute_all(
+        rarity: Any,
+        quality: Any,
+        level: Any,
+        luck: Any,
+        *,
+        out: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Calculate every statistic over arrays of inputs using NumPy broadcasting
+
+        Rarity, quality and level must broadcast against each other. Luck is
+        evaluated independently of them.
+
+        Args:
+            rarity: Scalar or array of zodiac rarities
+            quality: Scalar or array of zodiac qualities
+            level: Scalar or array of zodiac levels
+            luck: Scalar or array of luck values
+            out: Optional dictionary to store the results in
+
+        Returns:
+            Dict[str, Any]: Arrays keyed by "zodiac_score", "sale_price",
+            "enhance_price", "enhance_chance", "zodiac_luck", "rarity_weights" and
+            "rarity_chances". Weights and chances have shape luck.shape + (10,) with
+            the last axis in RARITY_NAMES order.
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if np is None:
+            raise ImportError("NumPy is required for batch calculations")
+
+        rarity = np.asarray(rarity, dtype=np.float64)
+        quality = np.asarray(quality, dtype=np.float64)
+        level = np.asarray(level, dtype=np.float64)
+        luck = np.asarray(luck, dtype=np.float64)
+        results: Dict[str, Any] = {} if out is None else out
+
+        with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+            rarity_mult = np.where(rarity > 8, 2.0, 1.0)
+            level_mult = np.power(np.maximum(1.0, (level - 90.0) * 0.1), 2.5)
+            score = (
+                np.power(1.125, rarity)
+                * quality
+                * (9 + level * level)
+                * rarity_mult
+                * level_mult
+            )
+            sale_price = np.power(score * 0.1, 0.75) * np.power(1.1, rarity)
+
+            log10_1pq = np.log10(1 + quality)
+            enhance_price = sale_price * 2 * np.power(1.3, log10_1pq)
+            enhance_chance = np.power(0.9, log10_1pq * log10_1pq) * 100
+
+            zodiac_luck = np.where(
+                luck < 18, luck, np.power(np.maximum(0.0, luck - 18), 0.3) * 18
+            )
+            weights = calculate_rarity_weights_vec(zodiac_luck).reshape(
+                zodiac_luck.shape + (len(RARITY_NAMES),)
+            )
+            total_weight = weights.sum(axis=-1, keepdims=True)
+            chances = np.divide(
+                weights * 100.0,
+                total_weight,
+                out=np.zeros_like(weights),
+                where=total_weight != 0,
+            )
+
+        results["zodiac_score"] = score
+        results["sale_price"] = sale_price
+        results["enhance_price"] = enhance_price
+        results["enhance_chance"] = enhance_chance
+        results["zodiac_luck"] = zodiac_luck
+        results["rarity_weights"] = weights
+        results["rarity_chances"] = chances
+        return results
+
     def get_user_input(self) -> bool:
         """
         Get optional input values from the user.
@@ -120,33 +475,20 @@ class ZodiacCalculator:
         Returns:
             str: Formatted number string
         """
-        if math.isinf(number):
+        magnitude = -number if number < 0 else number
+        if magnitude == _INF:
             return "∞ (Infinity)"
-        elif math.isnan(number):
+        elif number != number:  # NaN is the only value not equal to itself
             return "NaN (Invalid)"
-        elif abs(number) >= 1e6:
-            return f"{number:.2e}"
-        elif abs(number) >= 1000:
-            return f"{number:.2f}"
-        elif abs(number) >= 1:
-            return f"{number:.6f}"
+        elif magnitude >= 1e6:
+            spec = _FMT_SCI
+        elif magnitude >= 1000:
+            spec = _FMT_2
+        elif magnitude >= 1:
+            spec = _FMT_6
         else:
-            return f"{number:.8f}"
-
-    def _has_required_inputs(self, *required_fields: str) -> bool:
-        """
-        Check if required input fields are available.
-
-        Args:
-            *required_fields: Names of required fields
-
-        Returns:
-            bool: True if all required fields are available
-        """
-        for field in required_fields:
-            if getattr(self, field) is None:
-                return False
-        return True
+            spec = _FMT_8
+        return format(number, spec)
 
     def calculate_zodiac_sale_price(self) -> Optional[float]:
         """
@@ -154,65 +496,44 @@ class ZodiacCalculator:
 
         Returns:
             Optional[float]: Sale price if inputs are available, None otherwise
+
+        Raises:
+            ValueError: If the zodiac score is negative
+            OverflowError: If the rarity is too large to evaluate
         """
-        if not self._has_required_inputs(
-            "zodiac_rarity", "zodiac_quality", "zodiac_level"
+        if (
+            self.zodiac_rarity is None
+            or self.zodiac_quality is None
+            or self.zodiac_level is None
         ):
             logger.debug("Missing required inputs for zodiac sale price calculation")
             return None
 
-        # Type assertions after validation
-        assert self.zodiac_rarity is not None
-        assert self.zodiac_quality is not None
-        assert self.zodiac_level is not None
+        return _sale_price(self.zodiac_rarity, self.zodiac_quality, self.zodiac_level)
 
-        try:
-            # Conditional multipliers
-            rarity_mult = 2 if self.zodiac_rarity > 8 else 1
-            level_mult = (
-                ((self.zodiac_level - 90) / 10) ** 2.5
-                if self.zodiac_level >= 100
-                else 1
-            )
-
-            # Main formula
-            base_calc = (
-                1.125**self.zodiac_rarity
-                * self.zodiac_quality
-                * (9 + self.zodiac_level**2)
-                * rarity_mult
-                * level_mult
-            ) / 10
-
-            sale_price = (base_calc**0.75) * (1.1**self.zodiac_rarity)
-            logger.debug("Zodiac sale price calculated successfully")
-            return sale_price
-        except (ValueError, OverflowError) as e:
-            logger.error("Error calculating zodiac sale price: %s", e)
-            return None
-
-    def calculate_zodiac_enhance_price(self) -> Optional[float]:
+    def calculate_zodiac_enhance_price(
+        self, sell_cost: Optional[float] = None
+    ) -> Optional[float]:
         """
         Calculate Zodiac Enhance Price
 
+        Args:
+            sell_cost: Precomputed zodiac sale price, calculated if not given
+
         Returns:
             Optional[float]: Enhance price if inputs are available, None otherwise
+
+        Raises:
+            ValueError: If the zodiac score is negative or quality is -1 or less
+            OverflowError: If the rarity is too large to evaluate
         """
-        sell_cost = self.calculate_zodiac_sale_price()
-        if sell_cost is None or not self._has_required_inputs("zodiac_quality"):
+        if sell_cost is None:
+            sell_cost = self.calculate_zodiac_sale_price()
+        if sell_cost is None or self.zodiac_quality is None:
             logger.debug("Missing required inputs for zodiac enhance price calculation")
             return None
 
-        # Type assertion after validation
-        assert self.zodiac_quality is not None
-
-        try:
-            enhance_price = sell_cost * 2 * (1.3 ** math.log10(1 + self.zodiac_quality))
-            logger.debug("Zodiac enhance price calculated successfully")
-            return enhance_price
-        except (ValueError, OverflowError) as e:
-            logger.error("Error calculating zodiac enhance price: %s", e)
-            return None
+        return _enhance_price(sell_cost, self.zodiac_quality)
 
     def calculate_zodiac_enhance_chance(self) -> Optional[float]:
         """
@@ -220,23 +541,17 @@ class ZodiacCalculator:
 
         Returns:
             Optional[float]: Enhance chance if inputs are available, None otherwise
+
+        Raises:
+            ValueError: If quality is -1 or less
         """
-        if not self._has_required_inputs("zodiac_quality"):
+        if self.zodiac_quality is None:
             logger.debug(
                 "Missing required inputs for zodiac enhance chance calculation"
             )
             return None
 
-        # Type assertion after validation
-        assert self.zodiac_quality is not None
-
-        try:
-            chance = (0.9 ** (math.log10(1 + self.zodiac_quality) ** 2)) * 100
-            logger.debug("Zodiac enhance chance calculated successfully")
-            return chance
-        except (ValueError, OverflowError) as e:
-            logger.error("Error calculating zodiac enhance chance: %s", e)
-            return None
+        return _enhance_chance(self.zodiac_quality)
 
     def calculate_zodiac_score(self) -> Optional[float]:
         """
@@ -244,38 +559,19 @@ class ZodiacCalculator:
 
         Returns:
             Optional[float]: Zodiac score if inputs are available, None otherwise
+
+        Raises:
+            OverflowError: If the rarity is too large to evaluate
         """
-        if not self._has_required_inputs(
-            "zodiac_rarity", "zodiac_quality", "zodiac_level"
+        if (
+            self.zodiac_rarity is None
+            or self.zodiac_quality is None
+            or self.zodiac_level is None
         ):
             logger.debug("Missing required inputs for zodiac score calculation")
             return None
 
-        # Type assertions after validation
-        assert self.zodiac_rarity is not None
-        assert self.zodiac_quality is not None
-        assert self.zodiac_level is not None
-
-        try:
-            rarity_mult = 2 if self.zodiac_rarity > 8 else 1
-            level_mult = (
-                ((self.zodiac_level - 90) / 10) ** 2.5
-                if self.zodiac_level >= 100
-                else 1
-            )
-
-            score = (
-                1.125**self.zodiac_rarity
-                * self.zodiac_quality
-                * (9 + self.zodiac_level**2)
-                * rarity_mult
-                * level_mult
-            )
-            logger.debug("Zodiac score calculated successfully")
-            return score
-        except (ValueError, OverflowError) as e:
-            logger.error("Error calculating zodiac score: %s", e)
-            return None
+        return _zodiac_score(self.zodiac_rarity, self.zodiac_quality, self.zodiac_level)
 
     def calculate_zodiac_luck(self) -> Optional[float]:
         """
@@ -284,26 +580,13 @@ class ZodiacCalculator:
         Returns:
             Optional[float]: Zodiac luck if input is available, None otherwise
         """
-        if not self._has_required_inputs("luck"):
+        if self.luck is None:
             logger.debug("Missing required inputs for zodiac luck calculation")
             return None
 
-        # Type assertion after validation
-        assert self.luck is not None
+        return _zodiac_luck(self.luck)
 
-        try:
-            if self.luck < 18:
-                result = self.luck
-            else:
-                result = (self.luck - 18) ** 0.3 * 18
-
-            logger.debug("Zodiac luck calculated successfully")
-            return result
-        except (ValueError, OverflowError) as e:
-            logger.error("Error calculating zodiac luck: %s", e)
-            return None
-
-    def calculate_rarity_weights(self, zodiac_luck: float) -> Dict[str, float]:
+    def calculate_rarity_weights(self, zodiac_luck: float) -> Tuple[float, ...]:
         """
         Calculate weights for all rarities
 
@@ -311,211 +594,133 @@ class ZodiacCalculator:
             zodiac_luck: The calculated zodiac luck value
 
         Returns:
-            Dict[str, float]: Dictionary of rarity weights
-        """
-        weights = {}
+            Tuple[float, ...]: Rarity weights in RARITY_NAMES order
 
-        try:
-            # Garbage weight
-            if 1 <= zodiac_luck < 2:
-                weights["Garbage"] = 5 * (0.8 ** (zodiac_luck - 1))
-            elif 2 <= zodiac_luck < 3:
-                weights["Garbage"] = (
-                    5 * (0.8 ** (zodiac_luck - 1)) * (0.4 ** (zodiac_luck - 2))
-                )
-            else:
-                weights["Garbage"] = 0
-
-            # Common weight
-            if 1 <= zodiac_luck < 2:
-                weights["Common"] = 15
-            elif 2 <= zodiac_luck < 5:
-                weights["Common"] = 15 * (0.45 ** (zodiac_luck - 2))
-            else:
-                weights["Common"] = 0
-
-            # Uncommon weight
-            if 1 <= zodiac_luck < 3:
-                weights["Uncommon"] = 20 * (1.5 ** (zodiac_luck - 1)) - 12
-            elif 3 <= zodiac_luck < 8:
-                weights["Uncommon"] = (20 * (1.5 ** (zodiac_luck - 1)) - 12) * (
-                    0.5 ** (zodiac_luck - 3)
-                )
-            else:
-                weights["Uncommon"] = 0
-
-            # Rare weight
-            if 1 <= zodiac_luck < 5:
-                weights["Rare"] = 30 * (1.45 ** (zodiac_luck - 1)) - 28
-            elif 5 <= zodiac_luck < 12:
-                weights["Rare"] = (30 * (1.45 ** (zodiac_luck - 1)) - 28) * (
-                    0.55 ** (zodiac_luck - 5)
-                )
-            else:
-                weights["Rare"] = 0
-
-            # Epic weight
-            if 1 <= zodiac_luck < 8:
-                weights["Epic"] = max(0, 45 * (1.4 ** (zodiac_luck - 2)) - 50)
-            elif 8 <= zodiac_luck < 20:
-                weights["Epic"] = max(0, 45 * (1.4 ** (zodiac_luck - 2)) - 50) * (
-                    0.6 ** (zodiac_luck - 8)
-                )
-            else:
-                weights["Epic"] = 0
-
-            # Legendary weight
-            if 1 <= zodiac_luck < 12:
-                weights["Legendary"] = max(0, 80 * (1.36 ** (zodiac_luck - 3)) - 100)
-            elif 12 <= zodiac_luck < 30:
-                weights["Legendary"] = max(
-                    0, 80 * (1.36 ** (zodiac_luck - 3)) - 100
-                ) * (0.64 ** (zodiac_luck - 12))
-            else:
-                weights["Legendary"] = 0
-
-            # Mythic weight
-            if 1 <= zodiac_luck < 20:
-                weights["Mythic"] = max(0, 120 * (1.3 ** (zodiac_luck - 5)) - 140)
-            elif 20 <= zodiac_luck < 50:
-                weights["Mythic"] = max(0, 120 * (1.3 ** (zodiac_luck - 5)) - 140) * (
-                    0.67 ** (zodiac_luck - 20)
-                )
-            else:
-                weights["Mythic"] = 0
-
-            # Godly weight
-            if 1 <= zodiac_luck < 30:
-                weights["Godly"] = max(0, 150 * (1.25 ** (zodiac_luck - 8)) - 200)
-            elif 30 <= zodiac_luck < 60:
-                weights["Godly"] = max(0, 150 * (1.25 ** (zodiac_luck - 8)) - 200) * (
-                    0.7 ** (zodiac_luck - 30)
-                )
-            else:
-                weights["Godly"] = 0
-
-            # Divine weight
-            if 1 <= zodiac_luck < 40:
-                weights["Divine"] = max(0, 200 * (1.2 ** (zodiac_luck - 12)) - 300)
-            elif 40 <= zodiac_luck < 50:
-                weights["Divine"] = max(0, 200 * (1.2 ** (zodiac_luck - 12)) - 300) * (
-                    0.92 ** (zodiac_luck - 40)
-                )
-            elif 50 <= zodiac_luck < 70:
-                weights["Divine"] = (
-                    max(0, 200 * (1.2 ** (zodiac_luck - 12)) - 300)
-                    * (0.92 ** (zodiac_luck - 40))
-                    * (0.75 ** (zodiac_luck - 50))
-                )
-            else:
-                weights["Divine"] = 0
-
-            # Immortal weight
-            weights["Immortal"] = max(0, 300 * (1.1 ** (zodiac_luck - 20)) - 500)
-
-            logger.debug("Rarity weights calculated successfully")
-            return weights
+        Raises:
+            OverflowError: If zodiac luck is too large to evaluate
+        """
+        return _rarity_weights_kernel(zodiac_luck)
 
-        except (ValueError, OverflowError) as e:
-            logger.error("Error calculating rarity weights: %s", e)
-            return {
-                rarity: 0.0
-                for rarity in [
-                    "Garbage",
-                    "Common",
-                    "Uncommon",
-                    "Rare",
-                    "Epic",
-                    "Legendary",
-                    "Mythic",
-                    "Godly",
-                    "Divine",
-                    "Immortal",
-                ]
-            }
-
-    def calculate_rarity_chances(self, weights: Dict[str, float]) -> Dict[str, float]:
+    def calculate_rarity_chances(self, weights: Tuple[float, ...]) -> Tuple[float, ...]:
         """
         Calculate rarity chances from weights
 
         Args:
-            weights: Dictionary of rarity weights
+            weights: Rarity weights in RARITY_NAMES order
 
         Returns:
-            Dict[str, float]: Dictionary of rarity chances as percentages
+            Tuple[float, ...]: Rarity chances as percentages in RARITY_NAMES order
         """
-        total_weight = sum(weights.values())
-        if total_weight == 0:
+        chances = _rarity_chances(weights)
+        if chances is _ZERO_WEIGHTS:
             logger.warning("Total weight is zero, returning zero chances")
-            return {rarity: 0 for rarity in weights}
+        return chances
 
-        chances = {}
-        for rarity, weight in weights.items():
-            chances[rarity] = (weight / total_weight) * 100
+    def _calculate_or_none(
+        self, label: str, calculation: Callable[..., Any], *args: Any
+    ) -> Any:
+        """
+        Run a calculation for display, logging numeric errors instead of raising
 
-        logger.debug("Rarity chances calculated successfully")
-        return chances
+        Args:
+            label: Name of the calculation used in the error log
+            calculation: Calculation method to call
+            *args: Arguments passed to the calculation
+
+        Returns:
+            Any: Result of the calculation, or None if it failed
+        """
+        try:
+            return calculation(*args)
+        except (ValueError, OverflowError) as e:
+            logger.error("Error calculating %s: %s", label, e)
+            return None
 
     def display_results(self) -> None:
         """Display all calculation results based on available inputs"""
-        print("\n" + "=" * 50)
-        print("CALCULATION RESULTS")
-        print("=" * 50)
+        # Collect output lines and write them in one call at the end
+        out: List[str] = ["\n" + "=" * 50, "CALCULATION RESULTS", "=" * 50]
 
         # Track what calculations were performed
         calculations_performed = False
 
         # Basic calculations
-        sale_price = self.calculate_zodiac_sale_price()
-        enhance_price = self.calculate_zodiac_enhance_price()
-        enhance_chance = self.calculate_zodiac_enhance_chance()
-        zodiac_score = self.calculate_zodiac_score()
+        sale_price = self._calculate_or_none(
+            "zodiac sale price", self.calculate_zodiac_sale_price
+        )
+        # Enhance price needs the sale price, skip it if that already failed
+        enhance_price = (
+            None
+            if sale_price is None
+            else self._calculate_or_none(
+                "zodiac enhance price", self.calculate_zodiac_enhance_price, sale_price
+            )
+        )
+        enhance_chance = self._calculate_or_none(
+            "zodiac enhance chance", self.calculate_zodiac_enhance_chance
+        )
+        zodiac_score = self._calculate_or_none(
+            "zodiac score", self.calculate_zodiac_score
+        )
 
-        if any([sale_price, enhance_price, enhance_chance, zodiac_score]):
-            print("\n--- Basic Zodiac Calculations ---")
+        if (
+            sale_price is not None
+            or enhance_price is not None
+            or enhance_chance is not None
+            or zodiac_score is not None
+        ):
+            out.append("\n--- Basic Zodiac Calculations ---")
             calculations_performed = True
 
             if sale_price is not None:
-                print(f"Zodiac Sale Price: {self._format_number(sale_price)}")
-                print(
+                out.append(f"Zodiac Sale Price: {self._format_number(sale_price)}")
+                out.append(
                     "  Note: This is the base sale price, multiplied by the 'Wolf Skull' Relic"
                 )
             if enhance_price is not None:
-                print(f"Zodiac Enhance Price: {self._format_number(enhance_price)}")
+                out.append(
+                    f"Zodiac Enhance Price: {self._format_number(enhance_price)}"
+                )
             if enhance_chance is not None:
-                print(f"Zodiac Enhance Chance: {enhance_chance:.2f}%")
+                out.append(f"Zodiac Enhance Chance: {enhance_chance:.2f}%")
             if zodiac_score is not None:
-                print(f"Zodiac Score: {self._format_number(zodiac_score)}")
+                out.append(f"Zodiac Score: {self._format_number(zodiac_score)}")
 
         # Rarity calculations
-        zodiac_luck = self.calculate_zodiac_luck()
+        zodiac_luck = self._calculate_or_none("zodiac luck", self.calculate_zodiac_luck)
         if zodiac_luck is not None:
-            weights = self.calculate_rarity_weights(zodiac_luck)
+            weights = self._calculate_or_none(
+                "rarity weights", self.calculate_rarity_weights, zodiac_luck
+            )
+            if weights is None:
+                weights = _ZERO_WEIGHTS
             chances = self.calculate_rarity_chances(weights)
 
-            print("\n--- Rarity Analysis ---")
+            out.append("\n--- Rarity Analysis ---")
             calculations_performed = True
-            print(f"Zodiac Luck: {self._format_number(zodiac_luck)}")
+            out.append(f"Zodiac Luck: {self._format_number(zodiac_luck)}")
 
-            print("\nRarity Weights:")
-            for rarity, weight in weights.items():
-                print(f"  {rarity}: {self._format_number(weight)}")
+            out.append("\nRarity Weights:")
+            for rarity, weight in zip(RARITY_NAMES, weights):
+                out.append(f"  {rarity}: {self._format_number(weight)}")
 
-            print("\nRarity Chances:")
-            for rarity, chance in chances.items():
-                print(f"  {rarity}: {chance:.4f}%")
+            out.append("\nRarity Chances:")
+            for rarity, chance in zip(RARITY_NAMES, chances):
+                out.append(f"  {rarity}: {chance:.4f}%")
 
         if not calculations_performed:
-            print("\nNo calculations could be performed with the provided inputs.")
-            print(
+            out.append("\nNo calculations could be performed with the provided inputs.")
+            out.append(
                 "Please provide the required inputs for the calculations you want to see:"
             )
-            print("- Sale Price/Score: Requires rarity, quality, and level")
-            print(
+            out.append("- Sale Price/Score: Requires rarity, quality, and level")
+            out.append(
                 "- Enhance Price/Chance: Requires quality (and rarity/level for price)"
             )
-            print("- Rarity Analysis: Requires luck")
+            out.append("- Rarity Analysis: Requires luck")
 
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
         logger.debug("Results displayed successfully")
 
     def run(self) -> None:
@@ -560,15 +765,50 @@ class ZodiacCalculator:
         logger.debug("Program ended successfully")
 
 
-if __name__ == "__main__":
-    # Create logs directory if it doesn't exist
-    import os
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Command line entry point
 
-    os.makedirs("logs", exist_ok=True)
+    Runs a single calculation when any input is given as an option, otherwise
+    starts the interactive loop.
+
+    Args:
+        argv: Command line arguments, defaults to sys.argv[1:]
+    """
+    parser = argparse.ArgumentParser(
+        description="Revolution Idle Zodiac Calculator. "
+        "Run without options for interactive mode."
+    )
+    parser.add_argument("--rarity", type=float, default=None, help="Zodiac rarity")
+    parser.add_argument("--quality", type=float, default=None, help="Zodiac quality")
+    parser.add_argument("--level", type=float, default=None, help="Zodiac level")
+    parser.add_argument("--luck", type=float, default=None, help="Luck stat")
+    parser.add_argument("--immo", type=float, default=None, help="Immo+ number")
+    args = parser.parse_args(argv)
+
+    calculator = ZodiacCalculator()
+    calculator.zodiac_rarity = args.rarity
+    calculator.zodiac_quality = args.quality
+    calculator.zodiac_level = args.level
+    calculator.luck = args.luck
+    calculator.immo_number = args.immo
+
+    if any(
+        value is not None
+        for value in (args.rarity, args.quality, args.level, args.luck, args.immo)
+    ):
+        logger.debug("Running single calculation from command line arguments")
+        calculator.display_results()
+        return
+
+    calculator.run()
+
+
+if __name__ == "__main__":
+    _configure_logging()
 
     try:
-        calculator = ZodiacCalculator()
-        calculator.run()
+        main()
     except KeyboardInterrupt:
         logger.info("Program interrupted by user during startup")
         print("Program interrupted.")